@@ -18,10 +18,10 @@ import logging
 from os import environ
 from typing import Dict, Iterable, Optional
 from unittest import TestCase
-from unittest.mock import patch
 
 from opentelemetry import trace
 from opentelemetry.environment_variables import OTEL_PYTHON_ID_GENERATOR
+from opentelemetry.sdk import _configuration, util
 from opentelemetry.sdk._configuration import (
     _EXPORTER_OTLP,
     _EXPORTER_OTLP_PROTO_GRPC,
@@ -149,10 +149,10 @@ class DummyOTLPMetricExporter:
 
 class Exporter:
     def __init__(self):
-        tracer_provider = trace.get_tracer_provider()
+        resource = getattr(trace.get_tracer_provider(), "resource", None)
         self.service_name = (
-            tracer_provider.resource.attributes[SERVICE_NAME]
-            if getattr(tracer_provider, "resource", None)
+            resource.attributes[SERVICE_NAME]
+            if resource is not None
             else Resource.create().attributes.get(SERVICE_NAME)
         )
 
@@ -192,34 +192,113 @@ class IterEntryPoint:
         return self.class_type
 
 
-class TestTraceInit(TestCase):
+class _Recorder:
+    """Records the arguments of every call made to it."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+    def reset_mock(self):
+        self.calls.clear()
+
+    @property
+    def call_count(self):
+        return len(self.calls)
+
+    @property
+    def call_args(self):
+        return self.calls[-1]
+
+
+class _ListHandler(logging.Handler):
+    """Keeps every record it handles."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level=level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _swap_attributes(target, replacements):
+    """Sets the given attributes on target and returns the originals."""
+    saved = {name: getattr(target, name) for name in replacements}
+    for name, value in replacements.items():
+        setattr(target, name, value)
+    return saved
+
+
+def _restore_attributes(target, saved):
+    for name, value in saved.items():
+        setattr(target, name, value)
+
+
+def _swap_for_test(test, target, replacements):
+    """Sets the given attributes on target for the duration of the test."""
+    saved = _swap_attributes(target, replacements)
+    test.addCleanup(_restore_attributes, target, saved)
+
+
+def _set_environ(test, values):
+    """Updates os.environ for the duration of the given test."""
+    saved = {key: environ.get(key) for key in values}
+    environ.update(values)
+    test.addCleanup(_restore_environ, saved)
+
+
+def _restore_environ(saved):
+    for key, value in saved.items():
+        if value is None:
+            environ.pop(key, None)
+        else:
+            environ[key] = value
+
+
+class _PatchMixin:
+    """Replaces _configuration attributes for all tests of a class.
+
+    ``_patches`` lists the ``(name, replacement)`` pairs to install and
+    ``_provider_setter`` names the ``set_*_provider`` function that is
+    replaced by ``set_provider_mock``.
+    """
+
+    _patches = ()
+    _provider_setter = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.set_provider_mock = _Recorder()
+        replacements = dict(cls._patches)
+        replacements[cls._provider_setter] = cls.set_provider_mock
+        cls._saved = _swap_attributes(_configuration, replacements)
+
+    @classmethod
+    def tearDownClass(cls):
+        _restore_attributes(_configuration, cls._saved)
+        super().tearDownClass()
+
     def setUp(self):
-        super()
-        self.get_provider_patcher = patch(
-            "opentelemetry.sdk._configuration.TracerProvider", Provider
-        )
-        self.get_processor_patcher = patch(
-            "opentelemetry.sdk._configuration.BatchSpanProcessor", Processor
-        )
-        self.set_provider_patcher = patch(
-            "opentelemetry.sdk._configuration.set_tracer_provider"
-        )
+        super().setUp()
+        self.set_provider_mock.reset_mock()
 
-        self.get_provider_mock = self.get_provider_patcher.start()
-        self.get_processor_mock = self.get_processor_patcher.start()
-        self.set_provider_mock = self.set_provider_patcher.start()
 
-    def tearDown(self):
-        super()
-        self.get_provider_patcher.stop()
-        self.get_processor_patcher.stop()
-        self.set_provider_patcher.stop()
+class TestTraceInit(_PatchMixin, TestCase):
+    _patches = (
+        ("TracerProvider", Provider),
+        ("BatchSpanProcessor", Processor),
+    )
+    _provider_setter = "set_tracer_provider"
 
     # pylint: disable=protected-access
-    @patch.dict(
-        environ, {"OTEL_RESOURCE_ATTRIBUTES": "service.name=my-test-service"}
-    )
     def test_trace_init_default(self):
+        _set_environ(
+            self, {"OTEL_RESOURCE_ATTRIBUTES": "service.name=my-test-service"}
+        )
         _init_tracing({"zipkin": Exporter}, RandomIdGenerator, "test-version")
 
         self.assertEqual(self.set_provider_mock.call_count, 1)
@@ -236,11 +315,11 @@ class TestTraceInit(TestCase):
             "test-version",
         )
 
-    @patch.dict(
-        environ,
-        {"OTEL_RESOURCE_ATTRIBUTES": "service.name=my-otlp-test-service"},
-    )
     def test_trace_init_otlp(self):
+        _set_environ(
+            self,
+            {"OTEL_RESOURCE_ATTRIBUTES": "service.name=my-otlp-test-service"},
+        )
         _init_tracing({"otlp": OTLPSpanExporter}, RandomIdGenerator)
 
         self.assertEqual(self.set_provider_mock.call_count, 1)
@@ -255,14 +334,17 @@ class TestTraceInit(TestCase):
             "my-otlp-test-service",
         )
 
-    @patch.dict(environ, {OTEL_PYTHON_ID_GENERATOR: "custom_id_generator"})
-    @patch("opentelemetry.sdk._configuration.IdGenerator", new=IdGenerator)
-    @patch("opentelemetry.sdk.util.iter_entry_points")
-    def test_trace_init_custom_id_generator(self, mock_iter_entry_points):
-        mock_iter_entry_points.configure_mock(
-            return_value=[
-                IterEntryPoint("custom_id_generator", CustomIdGenerator)
-            ]
+    def test_trace_init_custom_id_generator(self):
+        _set_environ(self, {OTEL_PYTHON_ID_GENERATOR: "custom_id_generator"})
+        _swap_for_test(self, _configuration, {"IdGenerator": IdGenerator})
+        _swap_for_test(
+            self,
+            util,
+            {
+                "iter_entry_points": lambda *args, **kwargs: [
+                    IterEntryPoint("custom_id_generator", CustomIdGenerator)
+                ]
+            },
         )
         id_generator_name = _get_id_generator()
         id_generator = _import_id_generator(id_generator_name)
@@ -271,28 +353,14 @@ class TestTraceInit(TestCase):
         self.assertIsInstance(provider.id_generator, CustomIdGenerator)
 
 
-class TestLoggingInit(TestCase):
-    def setUp(self):
-        self.processor_patch = patch(
-            "opentelemetry.sdk._configuration.BatchLogRecordProcessor",
-            DummyLogRecordProcessor,
-        )
-        self.provider_patch = patch(
-            "opentelemetry.sdk._configuration.LoggerProvider",
-            DummyLoggerProvider,
-        )
-        self.set_provider_patch = patch(
-            "opentelemetry.sdk._configuration.set_logger_provider"
-        )
-
-        self.processor_mock = self.processor_patch.start()
-        self.provider_mock = self.provider_patch.start()
-        self.set_provider_mock = self.set_provider_patch.start()
+class TestLoggingInit(_PatchMixin, TestCase):
+    _patches = (
+        ("BatchLogRecordProcessor", DummyLogRecordProcessor),
+        ("LoggerProvider", DummyLoggerProvider),
+    )
+    _provider_setter = "set_logger_provider"
 
     def tearDown(self):
-        self.processor_patch.stop()
-        self.set_provider_patch.stop()
-        self.provider_patch.stop()
         root_logger = logging.getLogger("root")
         root_logger.handlers = [
             handler
@@ -300,6 +368,16 @@ class TestLoggingInit(TestCase):
             if not isinstance(handler, LoggingHandler)
         ]
 
+    def _record_init_calls(self):
+        logging_mock = _Recorder()
+        tracing_mock = _Recorder()
+        _swap_for_test(
+            self,
+            _configuration,
+            {"_init_logging": logging_mock, "_init_tracing": tracing_mock},
+        )
+        return logging_mock, tracing_mock
+
     def test_logging_init_empty(self):
         _init_logging({}, "auto-version")
         self.assertEqual(self.set_provider_mock.call_count, 1)
@@ -311,11 +389,10 @@ class TestLoggingInit(TestCase):
             "auto-version",
         )
 
-    @patch.dict(
-        environ,
-        {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"},
-    )
     def test_logging_init_exporter(self):
+        _set_environ(
+            self, {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"}
+        )
         _init_logging({"otlp": DummyOTLPLogExporter})
         self.assertEqual(self.set_provider_mock.call_count, 1)
         provider = self.set_provider_mock.call_args[0][0]
@@ -332,54 +409,35 @@ class TestLoggingInit(TestCase):
         logging.getLogger(__name__).error("hello")
         self.assertTrue(provider.processor.exporter.export_called)
 
-    @patch.dict(
-        environ,
-        {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"},
-    )
-    @patch("opentelemetry.sdk._configuration._init_tracing")
-    @patch("opentelemetry.sdk._configuration._init_logging")
-    def test_logging_init_disable_default(self, logging_mock, tracing_mock):
+    def test_logging_init_disable_default(self):
+        _set_environ(
+            self, {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"}
+        )
+        logging_mock, tracing_mock = self._record_init_calls()
         _initialize_components("auto-version")
         self.assertEqual(logging_mock.call_count, 0)
         self.assertEqual(tracing_mock.call_count, 1)
 
-    @patch.dict(
-        environ,
-        {
-            "OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service",
-            "OTEL_PYTHON_LOGGING_AUTO_INSTRUMENTATION_ENABLED": "True",
-        },
-    )
-    @patch("opentelemetry.sdk._configuration._init_tracing")
-    @patch("opentelemetry.sdk._configuration._init_logging")
-    def test_logging_init_enable_env(self, logging_mock, tracing_mock):
+    def test_logging_init_enable_env(self):
+        _set_environ(
+            self,
+            {
+                "OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service",
+                "OTEL_PYTHON_LOGGING_AUTO_INSTRUMENTATION_ENABLED": "True",
+            },
+        )
+        logging_mock, tracing_mock = self._record_init_calls()
         _initialize_components("auto-version")
         self.assertEqual(logging_mock.call_count, 1)
         self.assertEqual(tracing_mock.call_count, 1)
 
 
-class TestMetricsInit(TestCase):
-    def setUp(self):
-        self.metric_reader_patch = patch(
-            "opentelemetry.sdk._configuration.PeriodicExportingMetricReader",
-            DummyMetricReader,
-        )
-        self.provider_patch = patch(
-            "opentelemetry.sdk._configuration.MeterProvider",
-            DummyMeterProvider,
-        )
-        self.set_provider_patch = patch(
-            "opentelemetry.sdk._configuration.set_meter_provider"
-        )
-
-        self.metric_reader_mock = self.metric_reader_patch.start()
-        self.provider_mock = self.provider_patch.start()
-        self.set_provider_mock = self.set_provider_patch.start()
-
-    def tearDown(self):
-        self.metric_reader_patch.stop()
-        self.set_provider_patch.stop()
-        self.provider_patch.stop()
+class TestMetricsInit(_PatchMixin, TestCase):
+    _patches = (
+        ("PeriodicExportingMetricReader", DummyMetricReader),
+        ("MeterProvider", DummyMeterProvider),
+    )
+    _provider_setter = "set_meter_provider"
 
     def test_metrics_init_empty(self):
         _init_metrics({}, "auto-version")
@@ -394,11 +452,10 @@ class TestMetricsInit(TestCase):
             "auto-version",
         )
 
-    @patch.dict(
-        environ,
-        {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"},
-    )
     def test_metrics_init_exporter(self):
+        _set_environ(
+            self, {"OTEL_RESOURCE_ATTRIBUTES": "service.name=otlp-service"}
+        )
         _init_metrics({"otlp": DummyOTLPMetricExporter})
         self.assertEqual(self.set_provider_mock.call_count, 1)
         provider = self.set_provider_mock.call_args[0][0]
@@ -414,15 +471,26 @@ class TestMetricsInit(TestCase):
 
 
 class TestExporterNames(TestCase):
-    @patch.dict(
-        environ,
-        {
-            "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP,
-            "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP_PROTO_GRPC,
-            "OTEL_LOGS_EXPORTER": _EXPORTER_OTLP_PROTO_HTTP,
-        },
-    )
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.handler = _ListHandler(level=logging.WARNING)
+        logging.getLogger("opentelemetry").addHandler(cls.handler)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.getLogger("opentelemetry").removeHandler(cls.handler)
+        super().tearDownClass()
+
     def test_otlp_exporter(self):
+        _set_environ(
+            self,
+            {
+                "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP,
+                "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP_PROTO_GRPC,
+                "OTEL_LOGS_EXPORTER": _EXPORTER_OTLP_PROTO_HTTP,
+            },
+        )
         self.assertEqual(
             _get_exporter_names("traces"), [_EXPORTER_OTLP_PROTO_GRPC]
         )
@@ -433,16 +501,16 @@ class TestExporterNames(TestCase):
             _get_exporter_names("logs"), [_EXPORTER_OTLP_PROTO_HTTP]
         )
 
-    @patch.dict(
-        environ,
-        {
-            "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP,
-            "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP,
-            "OTEL_EXPORTER_OTLP_PROTOCOL": "http/protobuf",
-            "OTEL_EXPORTER_OTLP_METRICS_PROTOCOL": "grpc",
-        },
-    )
     def test_otlp_custom_exporter(self):
+        _set_environ(
+            self,
+            {
+                "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP,
+                "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP,
+                "OTEL_EXPORTER_OTLP_PROTOCOL": "http/protobuf",
+                "OTEL_EXPORTER_OTLP_METRICS_PROTOCOL": "grpc",
+            },
+        )
         self.assertEqual(
             _get_exporter_names("traces"), [_EXPORTER_OTLP_PROTO_HTTP]
         )
@@ -450,48 +518,77 @@ class TestExporterNames(TestCase):
             _get_exporter_names("metrics"), [_EXPORTER_OTLP_PROTO_GRPC]
         )
 
-    @patch.dict(
-        environ,
-        {
-            "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP_PROTO_HTTP,
-            "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP_PROTO_GRPC,
-            "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
-            "OTEL_EXPORTER_OTLP_METRICS_PROTOCOL": "http/protobuf",
-        },
-    )
     def test_otlp_exporter_conflict(self):
+        _set_environ(
+            self,
+            {
+                "OTEL_TRACES_EXPORTER": _EXPORTER_OTLP_PROTO_HTTP,
+                "OTEL_METRICS_EXPORTER": _EXPORTER_OTLP_PROTO_GRPC,
+                "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
+                "OTEL_EXPORTER_OTLP_METRICS_PROTOCOL": "http/protobuf",
+            },
+        )
         # Verify that OTEL_*_EXPORTER is used, and a warning is logged
-        with self.assertLogs(level="WARNING") as logs_context:
-            self.assertEqual(
-                _get_exporter_names("traces"), [_EXPORTER_OTLP_PROTO_HTTP]
-            )
-        assert len(logs_context.output) == 1
-
-        with self.assertLogs(level="WARNING") as logs_context:
-            self.assertEqual(
-                _get_exporter_names("metrics"), [_EXPORTER_OTLP_PROTO_GRPC]
-            )
-        assert len(logs_context.output) == 1
-
-    @patch.dict(environ, {"OTEL_TRACES_EXPORTER": "jaeger,zipkin"})
+        self.handler.records.clear()
+        self.assertEqual(
+            _get_exporter_names("traces"), [_EXPORTER_OTLP_PROTO_HTTP]
+        )
+        self.assertEqual(len(self.handler.records), 1)
+
+        self.handler.records.clear()
+        self.assertEqual(
+            _get_exporter_names("metrics"), [_EXPORTER_OTLP_PROTO_GRPC]
+        )
+        self.assertEqual(len(self.handler.records), 1)
+
     def test_multiple_exporters(self):
+        _set_environ(self, {"OTEL_TRACES_EXPORTER": "jaeger,zipkin"})
         self.assertEqual(
             sorted(_get_exporter_names("traces")), ["jaeger", "zipkin"]
         )
 
-    @patch.dict(environ, {"OTEL_TRACES_EXPORTER": "none"})
     def test_none_exporters(self):
+        _set_environ(self, {"OTEL_TRACES_EXPORTER": "none"})
         self.assertEqual(sorted(_get_exporter_names("traces")), [])
 
     def test_no_exporters(self):
         self.assertEqual(sorted(_get_exporter_names("traces")), [])
 
-    @patch.dict(environ, {"OTEL_TRACES_EXPORTER": ""})
     def test_empty_exporters(self):
+        _set_environ(self, {"OTEL_TRACES_EXPORTER": ""})
         self.assertEqual(sorted(_get_exporter_names("traces")), [])
 
 
 class TestImportExporters(TestCase):
+    _entry_points = {
+        "opentelemetry_traces_exporter": [
+            IterEntryPoint("console", ConsoleSpanExporter)
+        ],
+        "opentelemetry_metrics_exporter": [
+            IterEntryPoint("console", ConsoleMetricExporter)
+        ],
+        "opentelemetry_logs_exporter": [
+            IterEntryPoint("console", ConsoleLogExporter)
+        ],
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._saved = _swap_attributes(
+            util,
+            {
+                "iter_entry_points": lambda group: cls._entry_points.get(
+                    group, []
+                )
+            },
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        _restore_attributes(util, cls._saved)
+        super().tearDownClass()
+
     def test_console_exporters(self):
         trace_exporters, metric_exporterts, logs_exporters = _import_exporters(
             ["console"], ["console"], ["console"]